@@ -23,7 +23,7 @@ def main():
                 model="Llama-3-70B", 
                 role="critic", 
                 confidence=0.95, 
-                contribution_hash="e5f6g7h8" * 8
+                contribution_hash="e5f6a7b8" * 8
             )
         ],
         consensus_score=0.99
@@ -1,9 +1,80 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Literal
+from functools import lru_cache
+import os
+import re
+import time
+from types import MappingProxyType
+from typing import Annotated, Any, Iterable, List, Mapping, Optional, Literal, Tuple
 from enum import Enum
 import uuid
 import hashlib
-from pydantic import BaseModel, Field, computed_field, model_validator
+import numpy as np
+from pydantic import (
+    BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, PrivateAttr,
+    TypeAdapter, WithJsonSchema, computed_field, field_validator, model_validator,
+)
+
+# Optional BLAKE3 backend (C/SIMD, GIL-free); BLAKE2b-256 remains the default
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Opt-in JIT for the embedding sanity scan (EDUBBA_NUMBA_JIT=1). Plain NumPy by
+# default: importing and compiling numba costs far more cold start than it saves.
+njit = None
+if os.environ.get("EDUBBA_NUMBA_JIT") == "1":
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+# Shared config for small value-object models: immutable, hashable, no stray keys
+_LEAF_MODEL_CONFIG = ConfigDict(frozen=True, extra='forbid')
+
+# Hot leaf types are slotted frozen dataclasses. Pydantic still validates them
+# when nested in a model; direct construction only runs __post_init__ checks.
+_LEAF_DATACLASS_CONFIG = ConfigDict(extra='forbid')
+
+def _coerce_number(obj: Any, name: str, kind: type) -> None:
+    """
+    Coerces a frozen dataclass field to int/float in place, roughly like Pydantic's lax mode.
+    Rejects bools, non-numeric strings and ints that would lose a fraction.
+    """
+    value = getattr(obj, name)
+    if type(value) is kind:
+        return
+    try:
+        if isinstance(value, bool):
+            raise TypeError
+        coerced = kind(value)
+        if kind is int and coerced != float(value):
+            raise ValueError
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(
+            f"{type(obj).__name__}.{name} must be {kind.__name__}, got {value!r}."
+        ) from None
+    object.__setattr__(obj, name, coerced)
+
+# Shared bounded-float types (one range validator instead of one per field)
+UnitFloat = Annotated[float, Field(ge=0.0, le=1.0)]
+ZeroToTwo = Annotated[float, Field(ge=0.0, le=2.0)]
+
+# Timestamps taken within this window (seconds) share one datetime object
+_NOW_WINDOW = 0.001
+_now_cache = (0.0, datetime.fromtimestamp(0.0, timezone.utc))
+
+def _utcnow() -> datetime:
+    """
+    Timezone-aware UTC now, memoized per millisecond.
+    A node and its sub-models are stamped with one clock read and one datetime allocation.
+    """
+    global _now_cache
+    t = time.time()
+    if not 0.0 <= t - _now_cache[0] < _NOW_WINDOW:
+        _now_cache = (t, datetime.fromtimestamp(t, timezone.utc))
+    return _now_cache[1]
 
 # ==========================================
 # 1. INFRASTRUCTURE TAXONOMY (The Body)
@@ -38,6 +109,11 @@ class KnowledgeDomain(str, Enum):
     NEUROSCIENCE = "neuroscience"
     SYSTEMS = "systems"
 
+@lru_cache(maxsize=256)
+def _join_domains(domains: tuple) -> str:
+    """Comma-joined domain values, interned per distinct domain tuple."""
+    return ','.join(d.value for d in domains)
+
 # ==========================================
 # 2. HOMEOSTATIC STATE (The Soul)
 # ==========================================
@@ -51,10 +127,10 @@ class LatentStateContext(BaseModel):
     affect_vector: List[float] = Field(..., min_length=8, max_length=8)
     
     # 0.0 (Stable) -> 1.0 (Critical). The driver of active inquiry/curiosity.
-    dissonance_score: float = Field(..., ge=0.0, le=1.0)
+    dissonance_score: UnitFloat
     
     # The exploration temperature parameter used during this event
-    exploration_rate: float = Field(..., ge=0.0, le=2.0)
+    exploration_rate: ZeroToTwo
 
 # ==========================================
 # 3. CAUSAL TOPOLOGY (The Logic)
@@ -68,12 +144,101 @@ class EdgeRelation(str, Enum):
     RESOLVES = "resolves"       # A answers Question B
     MENTIONS = "mentions"       # Loose association
 
-class CausalEdge(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CausalEdge:
     """Directed, typed edge for the causal graph."""
+    __pydantic_config__ = _LEAF_DATACLASS_CONFIG
+
     target_id: uuid.UUID
     relation: EdgeRelation
-    weight: float = Field(1.0, ge=0.0, le=1.0)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    weight: UnitFloat = 1.0
+    created_at: datetime = field(default_factory=_utcnow)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.target_id, uuid.UUID):
+            try:
+                object.__setattr__(self, 'target_id', uuid.UUID(str(self.target_id)))
+            except ValueError:
+                raise ValueError(f"target_id must be a UUID, got {self.target_id!r}.") from None
+        object.__setattr__(self, 'relation', EdgeRelation(self.relation))
+        _coerce_number(self, 'weight', float)
+        if not 0.0 <= self.weight <= 1.0:
+            raise ValueError(f"Edge weight must be within [0, 1], got {self.weight}.")
+
+# Compact relation codes for packed edge storage (enum declaration order)
+_EDGE_RELATIONS = tuple(EdgeRelation)
+_EDGE_RELATION_CODES = {relation: code for code, relation in enumerate(_EDGE_RELATIONS)}
+
+EDGE_DTYPE = np.dtype([
+    ("target", "V16"),      # uuid.UUID.bytes
+    ("relation", "u1"),     # index into EdgeRelation
+    ("weight", "f4"),
+    ("created_at", "f8"),   # POSIX timestamp (UTC)
+])
+
+class EdgeStore:
+    """
+    Structure-of-arrays view over many causal edges.
+    Packs edges into one structured ndarray so graph filters run as a single vectorized scan.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._data = np.empty(capacity, dtype=EDGE_DTYPE)
+        self._size = 0
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[CausalEdge]) -> 'EdgeStore':
+        rows = [
+            (e.target_id.bytes, _EDGE_RELATION_CODES[e.relation], e.weight, e.created_at.timestamp())
+            for e in edges
+        ]
+        store = cls(capacity=0)
+        store._data = np.array(rows, dtype=EDGE_DTYPE)
+        store._size = len(rows)
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, edge: CausalEdge) -> None:
+        """Appends one edge, doubling the backing array when full."""
+        if self._size == len(self._data):
+            grown = np.empty(max(16, 2 * len(self._data)), dtype=EDGE_DTYPE)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size] = (
+            edge.target_id.bytes, _EDGE_RELATION_CODES[edge.relation],
+            edge.weight, edge.created_at.timestamp(),
+        )
+        self._size += 1
+
+    @property
+    def records(self) -> np.ndarray:
+        """Structured array of the stored edges (a view, not a copy)."""
+        return self._data[:self._size]
+
+    def select(
+        self, relation: Optional[EdgeRelation] = None, min_weight: Optional[float] = None
+    ) -> np.ndarray:
+        """Returns the records matching the relation and exceeding min_weight."""
+        records = self.records
+        mask = np.ones(self._size, dtype=bool)
+        if relation is not None:
+            mask &= records["relation"] == _EDGE_RELATION_CODES[EdgeRelation(relation)]
+        if min_weight is not None:
+            mask &= records["weight"] > min_weight
+        return records[mask]
+
+    def to_edges(self) -> List[CausalEdge]:
+        return [
+            CausalEdge(
+                target_id=uuid.UUID(bytes=rec["target"].tobytes()),
+                relation=_EDGE_RELATIONS[rec["relation"]],
+                weight=float(rec["weight"]),
+                created_at=datetime.fromtimestamp(float(rec["created_at"]), timezone.utc),
+            )
+            for rec in self.records
+        ]
 
 # ==========================================
 # 4. EPISTEMIC AUTHORITY (The Committee)
@@ -81,28 +246,110 @@ class CausalEdge(BaseModel):
 
 class ModelContributor(BaseModel):
     """Agent participation in consensus building."""
+    model_config = _LEAF_MODEL_CONFIG
+
     model: str = Field(..., json_schema_extra={"example": "DeepSeek-R1-Full"})
     role: Literal["proposer", "critic", "synthesizer", "human_oracle"]
-    confidence: float = Field(..., ge=0.0, le=1.0)
+    confidence: UnitFloat
     contribution_hash: str = Field(..., min_length=64, max_length=64)
 
+    _raw: bytes = PrivateAttr(default=b"")
+
+    @model_validator(mode='after')
+    def decode_contribution_hash(self) -> 'ModelContributor':
+        """
+        Validates the hex digest once and keeps its 32 raw bytes,
+        so provenance hashing consumes half the bytes with no per-call encoding.
+        """
+        try:
+            raw = bytes.fromhex(self.contribution_hash)
+        except ValueError:
+            raw = b""
+        if len(raw) != 32:
+            raise ValueError("contribution_hash must be a 64-character hex digest.")
+        self._raw = raw
+        return self
+
+HashAlgo = Literal["blake2b-256", "blake3-256"]
+
+def _new_hasher(algo: HashAlgo) -> Any:
+    if algo == "blake3-256":
+        if blake3 is None:
+            raise ValueError("hash_algo 'blake3-256' requires the 'blake3' package.")
+        return blake3()
+    return hashlib.blake2b(digest_size=32)
+
+@lru_cache(maxsize=128)
+def _prefix_hasher(method: str, score_repr: bytes, algo: HashAlgo) -> Any:
+    """
+    Hasher state with the method and score already absorbed (never mutated).
+    Keyed on the encoded score: equal floats such as 0.0 and -0.0 hash differently.
+    """
+    hasher = _new_hasher(algo)
+    hasher.update(method.encode())
+    hasher.update(score_repr)
+    return hasher
+
+def build_integrity_hash(
+    method: str, score: float, raw_hashes: Iterable[bytes], algo: HashAlgo = "blake2b-256"
+) -> str:
+    """
+    Integrity hash of a consensus event from its raw contribution digests.
+    Events sharing a method and score (e.g. a bulk audit replay) reuse one absorbed prefix.
+    """
+    hasher = _prefix_hasher(method, str(score).encode(), algo).copy()
+    for raw in raw_hashes:
+        hasher.update(raw)
+    return hasher.hexdigest()
+
 class ConsensusProvenance(BaseModel):
     """
     Cryptographic audit trail for truth establishment.
     Prevents hallucination cascades in rigorous domains (Math/Physics).
+    Frozen once validated, so the integrity hash is computed at most once.
     """
+    model_config = ConfigDict(frozen=True)
+
     method: Literal["unanimous", "majority_vote", "human_override"]
-    contributors: List[ModelContributor] = Field(..., min_length=1)
-    consensus_score: float = Field(..., ge=0.0, le=1.0, description="0.0=Contested, 1.0=Axiom")
+    contributors: Tuple[ModelContributor, ...] = Field(..., min_length=1)
+    consensus_score: UnitFloat = Field(..., description="0.0=Contested, 1.0=Axiom")
     dissent_notes: Optional[str] = None
-    established_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    established_at: datetime = Field(default_factory=_utcnow)
+    hash_algo: HashAlgo = "blake2b-256"
+
+    _integrity_hash: Optional[str] = PrivateAttr(default=None)
     
     @computed_field
     @property
     def integrity_hash(self) -> str:
-        """Immutable hash of the consensus event."""
-        payload = f"{self.method}{self.consensus_score}{''.join(c.contribution_hash for c in self.contributors)}"
-        return hashlib.sha3_256(payload.encode()).hexdigest()
+        """Immutable hash of the consensus event (memoized on first access)."""
+        if self._integrity_hash is None:
+            self._integrity_hash = build_integrity_hash(
+                self.method, self.consensus_score, (c._raw for c in self.contributors),
+                self.hash_algo,
+            )
+        return self._integrity_hash
+
+    @field_validator('hash_algo')
+    @classmethod
+    def validate_hash_algo(cls, v: HashAlgo) -> HashAlgo:
+        # Fail at load time rather than on first hash access
+        if v == "blake3-256" and blake3 is None:
+            raise ValueError("hash_algo 'blake3-256' requires the 'blake3' package.")
+        return v
+
+    def __eq__(self, other: object) -> bool:
+        # The memoized hash is derived state and must not affect equality
+        if not isinstance(other, ConsensusProvenance):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def model_copy(self, *, update=None, deep: bool = False) -> 'ConsensusProvenance':
+        # A copy with updated fields must not inherit the memoized hash
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._integrity_hash = None
+        return copied
 
 # ==========================================
 # 5. DATA GRAVITY & ARTIFACTS
@@ -115,14 +362,27 @@ class FileType(str, Enum):
     CODEBASE = "codebase"
     DATASET = "dataset"
 
+# Compiled once at import; paths must live under a mounted storage tier
+_ARTIFACT_PATH_RE = re.compile(r"^/mnt/[a-zA-Z0-9_\-/]+\.\w+$")
+
 class ArtifactPointer(BaseModel):
     """Pointer to external storage objects, keeping the Vector Index lean."""
+    model_config = _LEAF_MODEL_CONFIG
+
     tier: StorageTier
-    path: str = Field(..., pattern=r"^/mnt/[a-zA-Z0-9_\-/]+\.\w+$")
+    path: str = Field(..., json_schema_extra={"pattern": _ARTIFACT_PATH_RE.pattern})
     file_type: FileType
     checksum: str = Field(..., min_length=64, max_length=64)
     size_mb: float = Field(..., gt=0)
 
+    @field_validator('path')
+    @classmethod
+    def validate_path(cls, v: str) -> str:
+        # Cheap prefix test rejects most bad paths before the regex runs
+        if not v.startswith("/mnt/") or not _ARTIFACT_PATH_RE.fullmatch(v):
+            raise ValueError(f"Artifact path '{v}' must be a file under /mnt/.")
+        return v
+
 # ==========================================
 # 6. THE SYMBIOTE NODE (MemoryNode v5)
 # ==========================================
@@ -134,40 +394,128 @@ class NodeType(str, Enum):
     ARTIFACT = "artifact"   # File pointer
     QUESTION = "question"   # Active curiosity driver
 
-class MasteryState(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MasteryState:
     """User proficiency tracking for adaptive tutoring."""
+    __pydantic_config__ = _LEAF_DATACLASS_CONFIG
+
     domain: KnowledgeDomain
-    user_proficiency: float = Field(0.0, ge=0.0, le=1.0)
-    last_verified: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    user_proficiency: UnitFloat = 0.0
+    last_verified: datetime = field(default_factory=_utcnow)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'domain', KnowledgeDomain(self.domain))
+        _coerce_number(self, 'user_proficiency', float)
+        if not 0.0 <= self.user_proficiency <= 1.0:
+            raise ValueError(f"user_proficiency must be within [0, 1], got {self.user_proficiency}.")
    
-class IdentityBinding(BaseModel):
+@dataclass(slots=True, frozen=True)
+class IdentityBinding:
     """
     Biological Plasticity.
     Governs how tightly this memory is bound to the agent's identity.
     """
-    weight: float = Field(0.0, ge=0.0, le=1.0, description="0.0=Ephemeral, 1.0=Core Belief")
-    drift_pressure: float = Field(0.0, ge=0.0, description="Accumulated evidence contradicting this node")
-    is_protected: bool = Field(False, description="Immunity to garbage collection")
+    __pydantic_config__ = _LEAF_DATACLASS_CONFIG
+
+    weight: Annotated[UnitFloat, Field(description="0.0=Ephemeral, 1.0=Core Belief")] = 0.0
+    drift_pressure: Annotated[float, Field(ge=0.0, description="Accumulated evidence contradicting this node")] = 0.0
+    is_protected: Annotated[bool, Field(description="Immunity to garbage collection")] = False
 
-class MemoryUtility(BaseModel):
+    def __post_init__(self) -> None:
+        _coerce_number(self, 'weight', float)
+        _coerce_number(self, 'drift_pressure', float)
+        if not isinstance(self.is_protected, bool):
+            raise ValueError(f"IdentityBinding.is_protected must be bool, got {self.is_protected!r}.")
+        if not 0.0 <= self.weight <= 1.0:
+            raise ValueError(f"Identity weight must be within [0, 1], got {self.weight}.")
+        if self.drift_pressure < 0.0:
+            raise ValueError(f"drift_pressure must be non-negative, got {self.drift_pressure}.")
+
+@dataclass(slots=True, frozen=True)
+class MemoryUtility:
     """
     Metabolic Metrics.
     Used by the 'Dream Cycle' to prune (forget) or compress memories.
     """
+    __pydantic_config__ = _LEAF_DATACLASS_CONFIG
+
     access_count: int = 0
-    last_accessed: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    predictive_value: float = Field(0.0, description="Reward signal: Did this help predict user intent?")
-    redundancy_score: float = Field(0.0, description="Cluster density overlap (for compression)")
+    last_accessed: datetime = field(default_factory=_utcnow)
+    predictive_value: Annotated[float, Field(description="Reward signal: Did this help predict user intent?")] = 0.0
+    redundancy_score: Annotated[float, Field(description="Cluster density overlap (for compression)")] = 0.0
+
+    def __post_init__(self) -> None:
+        _coerce_number(self, 'access_count', int)
+        _coerce_number(self, 'predictive_value', float)
+        _coerce_number(self, 'redundancy_score', float)
 
-class RecallDynamics(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RecallDynamics:
     """
     Entropy & Distortion.
     Tracks how the narrative changes each time it is remembered (re-consolidation).
     """
+    __pydantic_config__ = _LEAF_DATACLASS_CONFIG
+
     recall_count: int = 0
-    distortion_score: float = Field(0.0, description="Semantic drift from original event")
+    distortion_score: Annotated[float, Field(description="Semantic drift from original event")] = 0.0
     last_reinforced: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        _coerce_number(self, 'recall_count', int)
+        _coerce_number(self, 'distortion_score', float)
     
+# Expected embedding dimensions for supported models (add future models here)
+_MODEL_DIMS: Mapping[str, int] = MappingProxyType({
+    "bge-m3-v1.5": 1024,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+})
+
+# Minimum length accepted for embeddings from unknown models
+_MIN_EMBEDDING_DIM = 8
+
+def _as_embedding(value: Any) -> np.ndarray:
+    """
+    Coerces a vector to a read-only float32 array in one C-level pass.
+    Read-only so in-place edits cannot desync the node's cached norm and int8 copy.
+    """
+    try:
+        with np.errstate(over='raise'):
+            arr = np.array(value, dtype=np.float32)
+    except FloatingPointError:
+        raise ValueError("Embedding contains values out of float32 range.") from None
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Embedding must be a sequence of floats: {exc}") from exc
+    if arr.ndim != 1:
+        raise ValueError(f"Embedding must be one-dimensional, got shape {arr.shape}.")
+    arr.flags.writeable = False
+    return arr
+
+if njit is not None:
+    @njit(cache=True)
+    def _all_finite(arr: np.ndarray) -> bool:
+        """True when the vector holds no NaN/inf; exits on the first bad value."""
+        for i in range(arr.shape[0]):
+            if not np.isfinite(arr[i]):
+                return False
+        return True
+else:
+    def _all_finite(arr: np.ndarray) -> bool:
+        """True when the vector holds no NaN/inf."""
+        return bool(np.isfinite(arr).all())
+
+def _embedding_to_list(arr: np.ndarray) -> List[float]:
+    return np.asarray(arr, dtype=np.float32).tolist()
+
+# float32 vector validated as a whole rather than element by element
+Embedding = Annotated[
+    np.ndarray,
+    PlainValidator(_as_embedding),
+    PlainSerializer(_embedding_to_list, return_type=List[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
 class MemoryNode(BaseModel):
     """
     Atomic unit of the Edubba Protocol v5.
@@ -187,7 +535,7 @@ class MemoryNode(BaseModel):
     artifact: Optional[ArtifactPointer] = None
     
     # --- Vector Representation ---
-    embedding: List[float] = Field(...)
+    embedding: Embedding = Field(...)
     embedding_model: str = "bge-m3-v1.5"
     embedding_version: str = "1.0"
     
@@ -195,9 +543,9 @@ class MemoryNode(BaseModel):
     latent_context: Optional[LatentStateContext] = None
     
     # --- Biological Dynamics (RESTORED) ---
-    identity: IdentityBinding = Field(default_factory=IdentityBinding)
+    identity: IdentityBinding = IdentityBinding()
     utility: MemoryUtility = Field(default_factory=MemoryUtility)
-    recall: RecallDynamics = Field(default_factory=RecallDynamics)
+    recall: RecallDynamics = RecallDynamics()
 
     # --- Epistemic Rigor (The Truth) ---
     provenance: ConsensusProvenance
@@ -210,8 +558,39 @@ class MemoryNode(BaseModel):
     neuromorphic_signature: Optional[str] = Field(None)
 
     # --- Metadata ---
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_accessed: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    last_accessed: datetime = Field(default_factory=_utcnow)
+
+    # (domains, dissonance) the packet was built from, and the packet itself
+    _diode_key: Optional[tuple] = PrivateAttr(default=None)
+    _diode_cache: Optional[bytes] = PrivateAttr(default=None)
+    _embedding_norm: Optional[float] = PrivateAttr(default=None)
+    _quantized: Optional[Tuple[np.ndarray, float]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # No validate_assignment: coerce here so the field always holds a float32 array
+        if name == 'embedding':
+            value = _as_embedding(value)
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            self._diode_cache = None
+            if name == 'embedding':
+                self._embedding_norm = None
+                self._quantized = None
+
+    def model_copy(self, *, update=None, deep: bool = False) -> 'MemoryNode':
+        # Private caches are copied verbatim; an updated copy must rebuild them
+        if update and 'embedding' in update:
+            update = {**update, 'embedding': _as_embedding(update['embedding'])}
+        copied = super().model_copy(update=update, deep=deep)
+        if deep:
+            # deepcopy hands back a writeable array
+            copied.embedding.flags.writeable = False
+        if update:
+            copied._diode_cache = None
+            copied._embedding_norm = None
+            copied._quantized = None
+        return copied
 
     # --- Validators ---
     @model_validator(mode='after')
@@ -220,45 +599,130 @@ class MemoryNode(BaseModel):
         Validates embedding dimensions based on the model.
         Supports future extensibility for other models (e.g., text-embedding-3-large).
         """
-        # Define expected dimensions for supported models
-        MODEL_DIMENSIONS = {
-            "bge-m3-v1.5": 1024,
-            "text-embedding-3-small": 1536,
-            "text-embedding-3-large": 3072,
-            # Add future models here
-        }
-        
-        expected_dim = MODEL_DIMENSIONS.get(self.embedding_model)
+        expected_dim = _MODEL_DIMS.get(self.embedding_model)
+        actual_dim = self.embedding.shape[0]
         
         # If model is known, enforce exact dimension
-        if expected_dim and len(self.embedding) != expected_dim:
+        if expected_dim and actual_dim != expected_dim:
             raise ValueError(
                 f"Embedding dimension mismatch for model '{self.embedding_model}'. "
-                f"Expected {expected_dim}, got {len(self.embedding)}."
+                f"Expected {expected_dim}, got {actual_dim}."
             )
         
         # If model is unknown, ensure at least some minimum sanity check
         # This allows for custom models without crashing, but flags potentially empty vectors
-        if not expected_dim and len(self.embedding) < 8:
-             raise ValueError(f"Embedding length {len(self.embedding)} is too short for a valid vector.")
+        if not expected_dim and actual_dim < _MIN_EMBEDDING_DIM:
+             raise ValueError(f"Embedding length {actual_dim} is too short for a valid vector.")
+
+        # NaN/inf would silently poison every similarity score against this node
+        if not _all_finite(self.embedding):
+            raise ValueError("Embedding contains non-finite values (NaN or inf).")
 
         return self
 
+    @property
+    def embedding_norm(self) -> float:
+        """L2 norm of the embedding, computed once and reused by similarity search."""
+        if self._embedding_norm is None:
+            self._embedding_norm = float(np.linalg.norm(self.embedding))
+        return self._embedding_norm
+
+    def _check_comparable(self, other: 'MemoryNode') -> None:
+        if self.embedding.shape != other.embedding.shape:
+            raise ValueError(
+                f"Cannot compare embeddings from '{self.embedding_model}' "
+                f"(dim {self.embedding.shape[0]}) and '{other.embedding_model}' "
+                f"(dim {other.embedding.shape[0]})."
+            )
+
+    def cosine_similarity(self, other: 'MemoryNode') -> float:
+        """Cosine similarity of two nodes' embeddings (0.0 if either vector is zero)."""
+        self._check_comparable(other)
+        denom = self.embedding_norm * other.embedding_norm
+        if denom == 0.0:
+            return 0.0
+        return float(np.dot(self.embedding, other.embedding)) / denom
+
+    @property
+    def quantized_embedding(self) -> Tuple[np.ndarray, float]:
+        """
+        Symmetric int8 copy of the embedding and its fp32 scale (embedding ~= q * scale).
+        A quarter of the float32 size, for compact T1 index storage.
+        """
+        if self._quantized is None:
+            arr = np.asarray(self.embedding, dtype=np.float32)
+            peak = float(np.abs(arr).max()) if arr.size else 0.0
+            scale = peak / 127.0
+            if scale == 0.0:
+                q = np.zeros(arr.shape, dtype=np.int8)
+            else:
+                q = np.round(arr / scale).astype(np.int8)
+            self._quantized = (q, scale)
+        return self._quantized
+
+    def approx_cosine_similarity(self, other: 'MemoryNode') -> float:
+        """Cosine similarity from the int8 embeddings (int32 accumulation, no overflow)."""
+        self._check_comparable(other)
+        denom = self.embedding_norm * other.embedding_norm
+        if denom == 0.0:
+            return 0.0
+        q_a, scale_a = self.quantized_embedding
+        q_b, scale_b = other.quantized_embedding
+        dot = int(np.dot(q_a.astype(np.int32), q_b.astype(np.int32)))
+        return dot * scale_a * scale_b / denom
+
+    def add_edge(
+        self, target_id: uuid.UUID, relation: EdgeRelation, weight: float = 1.0
+    ) -> CausalEdge:
+        """Links this node to another and returns the new edge."""
+        edge = CausalEdge(target_id=target_id, relation=relation, weight=weight)
+        self.edges.append(edge)
+        return edge
+
+    def __eq__(self, other: object) -> bool:
+        # The default field-wise comparison is ambiguous for ndarray embeddings
+        if not isinstance(other, MemoryNode):
+            return NotImplemented
+        if not np.array_equal(self.embedding, other.embedding):
+            return False
+        mine = {k: v for k, v in self.__dict__.items() if k != 'embedding'}
+        theirs = {k: v for k, v in other.__dict__.items() if k != 'embedding'}
+        return mine == theirs
+
     @model_validator(mode='after')
     def validate_restricted_access(self) -> 'MemoryNode':
         if self.classification == DataClassification.RESTRICTED and not self.artifact:
             raise ValueError("RESTRICTED classification requires artifact pointer.")
         return self
 
+    @property
+    def diode_packet_bytes(self) -> Optional[bytes]:
+        """
+        ASCII audit packet for the optical diode, built once and cached.
+        Field reassignment and model_copy(update=...) clear the cache; in-place edits
+        to the domains list or the latent context are detected by re-checking those two inputs.
+        """
+        if self.classification != DataClassification.RESTRICTED:
+            return None
+        domains = tuple(self.domains)
+        dissonance = self.latent_context.dissonance_score if self.latent_context else 0.0
+        key = (domains, dissonance)
+        if self._diode_cache is None or self._diode_key != key:
+            self._diode_cache = (
+                b"SHA:" + self.provenance.integrity_hash.encode('ascii')
+                + b"|ID:" + str(self.id).encode('ascii')
+                + b"|DOM:" + _join_domains(domains).encode('ascii')
+                + b"|DISS:" + f"{dissonance:.2f}".encode('ascii')
+            )
+            self._diode_key = key
+        return self._diode_cache
+
     @computed_field
     @property
     def diode_packet(self) -> Optional[str]:
-        if self.classification == DataClassification.RESTRICTED:
-            dissonance = self.latent_context.dissonance_score if self.latent_context else 0.0
-            return (
-                f"SHA:{self.provenance.integrity_hash}|"
-                f"ID:{self.id}|"
-                f"DOM:{','.join(self.domains)}|"
-                f"DISS:{dissonance:.2f}"
-            )
-        return None
\ No newline at end of file
+        packet = self.diode_packet_bytes
+        return packet.decode('ascii') if packet is not None else None
+
+# Validator for bulk payloads (e.g. archive transfer), built once at import
+# so every batch reuses the same compiled pydantic-core schema.
+MEMORY_NODE_LIST_ADAPTER: TypeAdapter[List[MemoryNode]] = TypeAdapter(List[MemoryNode])
@@ -1,10 +1,16 @@
 import pytest
 import uuid
+import hashlib
+import numpy as np
+from dataclasses import FrozenInstanceError
+from datetime import timezone
+from pydantic import ValidationError
 from src.schema import (
     MemoryNode, NodeType, KnowledgeDomain, StorageTier, DataClassification,
     ConsensusProvenance, ModelContributor, LatentStateContext, 
     ArtifactPointer, FileType, IdentityBinding, MemoryUtility, RecallDynamics,
-    CausalEdge, EdgeRelation
+    CausalEdge, EdgeRelation, EdgeStore, build_integrity_hash,
+    MEMORY_NODE_LIST_ADAPTER
 )
 
 # --- FIXTURES (Standardized Test Data) ---
@@ -144,4 +150,437 @@ def test_audit_logging_psychometrics(valid_embedding, valid_provenance, valid_la
     
     assert "DISS:0.20" in packet
     assert f"ID:{node.id}" in packet
-    assert "SHA:" in packet
\ No newline at end of file
+    assert "SHA:" in packet
+
+def test_integrity_hash_is_memoized(valid_provenance):
+    """
+    The consensus event is frozen, so its hash is computed once and reused.
+    Copies with updated fields must be re-hashed rather than inheriting the cache.
+    """
+    first = valid_provenance.integrity_hash
+    assert len(first) == 64
+    assert valid_provenance.integrity_hash is first
+    assert valid_provenance == valid_provenance.model_copy(update={"dissent_notes": None})
+
+    with pytest.raises(ValueError):
+        valid_provenance.consensus_score = 0.5
+    with pytest.raises(AttributeError):
+        valid_provenance.contributors.append(valid_provenance.contributors[0])
+
+    contested = valid_provenance.model_copy(update={"consensus_score": 0.5})
+    assert contested.integrity_hash != first
+
+def test_integrity_hash_algorithm(valid_provenance):
+    """The integrity hash is BLAKE2b-256 and the primitive is recorded on the event."""
+    payload = b"unanimous0.99" + bytes.fromhex("a" * 64)
+    assert valid_provenance.hash_algo == "blake2b-256"
+    assert valid_provenance.integrity_hash == hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+def test_contribution_hash_must_be_hex():
+    """Contribution hashes are hex digests; right length alone is not enough."""
+    with pytest.raises(ValueError, match="64-character hex digest"):
+        ModelContributor(
+            model="Llama-3-70B",
+            role="critic",
+            confidence=0.95,
+            contribution_hash="e5f6g7h8" * 8
+        )
+
+def test_embedding_stored_as_float32_array(valid_embedding, valid_provenance):
+    """Embeddings are validated as one float32 array and serialize back to plain floats."""
+    node = MemoryNode(
+        type=NodeType.CONCEPT,
+        domains=[KnowledgeDomain.GENERAL],
+        content_summary="Vectorized embedding storage",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+    )
+
+    assert isinstance(node.embedding, np.ndarray)
+    assert node.embedding.dtype == np.float32
+    assert node.embedding.shape == (1024,)
+    assert isinstance(node.model_dump()["embedding"], list)
+    assert MemoryNode.model_validate_json(node.model_dump_json()) == node
+
+    with pytest.raises(ValueError, match="one-dimensional"):
+        MemoryNode(
+            type=NodeType.CONCEPT,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Vectorized embedding storage",
+            embedding=[[0.05] * 1024],
+            provenance=valid_provenance,
+        )
+
+def test_embedding_assigned_as_list_is_coerced(valid_embedding, valid_provenance):
+    """Lists assigned or copied in as embeddings are stored as float32 arrays and still serialize."""
+    node = MemoryNode(
+        type=NodeType.CONCEPT,
+        domains=[KnowledgeDomain.GENERAL],
+        content_summary="Vectorized embedding storage",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+    )
+    node.embedding = [0.25] * 1024
+    assert node.embedding.dtype == np.float32
+    assert MemoryNode.model_validate_json(node.model_dump_json()) == node
+
+    copied = node.model_copy(update={"embedding": [0.5] * 1024})
+    assert copied.embedding.dtype == np.float32
+    assert copied.model_dump()["embedding"] == [0.5] * 1024
+
+    with pytest.raises(ValueError, match="one-dimensional"):
+        node.embedding = [[0.25] * 1024]
+
+def test_leaf_models_are_immutable_values(valid_embedding, valid_provenance):
+    """Leaf value objects are frozen, hashable, range-checked, and reject unknown keys."""
+    binding = IdentityBinding(weight=0.5)
+
+    with pytest.raises(FrozenInstanceError):
+        binding.weight = 0.9
+    assert hash(binding) == hash(IdentityBinding(weight=0.5))
+    assert not hasattr(binding, "__dict__")
+
+    with pytest.raises(ValueError, match="within \\[0, 1\\]"):
+        IdentityBinding(weight=1.5)
+    with pytest.raises(TypeError):
+        RecallDynamics(recall_count=1, recal_count=2)
+
+    # Nested in a node, the dataclasses are still validated by Pydantic
+    with pytest.raises(ValidationError, match="recal_count"):
+        MemoryNode(
+            type=NodeType.EPISODIC,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Nested leaf validation",
+            embedding=valid_embedding,
+            provenance=valid_provenance,
+            recall={"recall_count": 1, "recal_count": 2},
+        )
+
+def test_default_timestamps_are_utc(valid_embedding, valid_provenance):
+    """Default timestamps are timezone-aware UTC and never run backwards."""
+    node = MemoryNode(
+        type=NodeType.EPISODIC,
+        domains=[KnowledgeDomain.GENERAL],
+        content_summary="Timestamp defaults",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+    )
+
+    assert node.created_at.tzinfo is timezone.utc
+    assert node.utility.last_accessed.tzinfo is timezone.utc
+    assert valid_provenance.established_at <= node.created_at <= node.last_accessed
+
+def test_edge_store_vectorized_filter(valid_embedding, valid_provenance):
+    """
+    A node's edges can be packed into a structured array and
+    filtered by relation and weight in one scan, then unpacked again.
+    """
+    node = MemoryNode(
+        type=NodeType.CONCEPT,
+        domains=[KnowledgeDomain.SYSTEMS],
+        content_summary="Packed causal edges",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+    )
+    strong = node.add_edge(uuid.uuid4(), EdgeRelation.REINFORCES, weight=0.75)
+    node.add_edge(uuid.uuid4(), EdgeRelation.REINFORCES, weight=0.25)
+    node.add_edge(uuid.uuid4(), EdgeRelation.CONTRADICTS, weight=0.5)
+
+    store = EdgeStore.from_edges(node.edges)
+    assert len(store) == 3
+
+    hits = store.select(relation=EdgeRelation.REINFORCES, min_weight=0.5)
+    assert len(hits) == 1
+    assert uuid.UUID(bytes=hits[0]["target"].tobytes()) == strong.target_id
+
+    # Weights are packed as float32; these test weights are exactly representable
+    grown = EdgeStore(capacity=1)
+    for edge in node.edges:
+        grown.append(edge)
+    assert grown.to_edges() == node.edges
+
+def test_diode_packet_tracks_identity(valid_embedding, valid_provenance):
+    """The diode packet lists domains in order and follows a reassigned node id."""
+    node = MemoryNode(
+        type=NodeType.PROOF,
+        domains=[KnowledgeDomain.PHYSICS_QFT, KnowledgeDomain.SYSTEMS],
+        content_summary="Restricted Derivation",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+        classification=DataClassification.RESTRICTED,
+        artifact=ArtifactPointer(
+            tier=StorageTier.T4_DEEP_ARCHIVE,
+            path="/mnt/qft/proof.pdf",
+            file_type=FileType.PDF,
+            checksum="c" * 64,
+            size_mb=5.0
+        )
+    )
+
+    assert "|DOM:physics_qft,systems|" in node.diode_packet
+    assert f"ID:{node.id}|" in node.diode_packet
+
+    node.id = uuid.uuid4()
+    assert f"ID:{node.id}|" in node.diode_packet
+
+    # The packet is cached as bytes, but in-place edits still show up
+    assert node.diode_packet_bytes is node.diode_packet_bytes
+    node.domains.append(KnowledgeDomain.GENERAL)
+    assert node.diode_packet_bytes.endswith(b"|DOM:physics_qft,systems,general|DISS:0.00")
+
+    # Updated copies carry their own id, not the cached packet of the original
+    copy_id = uuid.uuid4()
+    copied = node.model_copy(update={"id": copy_id})
+    assert f"ID:{copy_id}|" in copied.diode_packet
+    assert f"ID:{node.id}|" in node.diode_packet
+
+    node.classification = DataClassification.INTERNAL
+    assert node.diode_packet is None
+
+def test_build_integrity_hash_matches_provenance(valid_provenance):
+    """The bulk helper reproduces the provenance hash and does not conflate 1 with 1.0."""
+    raw = [bytes.fromhex("a" * 64)]
+
+    assert build_integrity_hash("unanimous", 0.99, raw) == valid_provenance.integrity_hash
+    assert build_integrity_hash("unanimous", 0.99, raw) == build_integrity_hash("unanimous", 0.99, iter(raw))
+    assert build_integrity_hash("unanimous", 1, raw) != build_integrity_hash("unanimous", 1.0, raw)
+
+def test_build_integrity_hash_independent_of_call_order():
+    """0.0 and -0.0 compare equal but encode differently; the prefix cache must not mix them."""
+    raw = [bytes.fromhex("b" * 64)]
+
+    def digest(score):
+        h = hashlib.blake2b(digest_size=32)
+        h.update(b"unanimous" + str(score).encode())
+        h.update(raw[0])
+        return h.hexdigest()
+
+    assert build_integrity_hash("unanimous", -0.0, raw) == digest(-0.0)
+    assert build_integrity_hash("unanimous", 0.0, raw) == digest(0.0)
+    assert build_integrity_hash("unanimous", -0.0, raw) == digest(-0.0)
+
+@pytest.mark.parametrize("path", ["/etc/passwd.txt", "/mnt/no_extension", "/mnt/log.pdf\n", "/mnt/a b.pdf"])
+def test_artifact_path_rejects_paths_outside_mounts(path):
+    """Artifact pointers only accept file paths under /mnt/."""
+    with pytest.raises(ValueError, match="must be a file under /mnt/"):
+        ArtifactPointer(
+            tier=StorageTier.T2_WARM_POOL,
+            path=path,
+            file_type=FileType.PDF,
+            checksum="d" * 64,
+            size_mb=1.0
+        )
+
+def test_default_node_ids_are_random_uuid4(valid_embedding, valid_provenance):
+    """Default node ids are well-formed, distinct version-4 UUIDs."""
+    ids = [
+        MemoryNode(
+            type=NodeType.EPISODIC,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Identifier defaults",
+            embedding=valid_embedding,
+            provenance=valid_provenance,
+        ).id
+        for _ in range(32)
+    ]
+
+    assert len(set(ids)) == len(ids)
+    for node_id in ids:
+        assert node_id.version == 4
+        assert node_id.variant == uuid.RFC_4122
+        assert uuid.UUID(str(node_id)) == node_id
+
+def test_bulk_json_round_trip(valid_embedding, valid_provenance):
+    """Batches of nodes parse through the shared list adapter."""
+    nodes = [
+        MemoryNode(
+            type=NodeType.CONCEPT,
+            domains=[KnowledgeDomain.SYSTEMS],
+            content_summary=f"Archived concept {i}",
+            embedding=valid_embedding,
+            provenance=valid_provenance,
+        )
+        for i in range(3)
+    ]
+
+    payload = MEMORY_NODE_LIST_ADAPTER.dump_json(nodes)
+    assert MEMORY_NODE_LIST_ADAPTER.validate_json(payload) == nodes
+
+def test_blake3_integrity_hash(valid_provenance):
+    """Opting into BLAKE3 changes the primitive, and the choice is part of the record."""
+    blake3 = pytest.importorskip("blake3")
+
+    prov = ConsensusProvenance(**{
+        **valid_provenance.model_dump(exclude={"integrity_hash"}),
+        "hash_algo": "blake3-256",
+    })
+    payload = b"unanimous0.99" + bytes.fromhex("a" * 64)
+
+    assert prov.integrity_hash == blake3.blake3(payload).hexdigest()
+    assert prov.integrity_hash != valid_provenance.integrity_hash
+
+def test_blake3_requires_backend(valid_provenance, monkeypatch):
+    """Records that need BLAKE3 fail validation when the backend is missing."""
+    import src.schema
+
+    monkeypatch.setattr(src.schema, "blake3", None)
+    with pytest.raises(ValueError, match="requires the 'blake3' package"):
+        ConsensusProvenance(**{
+            **valid_provenance.model_dump(exclude={"integrity_hash"}),
+            "hash_algo": "blake3-256",
+        })
+
+@pytest.mark.parametrize("bad", [float("nan"), float("inf")])
+def test_embedding_rejects_non_finite_values(valid_embedding, valid_provenance, bad):
+    """A single NaN/inf component invalidates the whole vector."""
+    embedding = list(valid_embedding)
+    embedding[511] = bad
+
+    with pytest.raises(ValueError, match="non-finite"):
+        MemoryNode(
+            type=NodeType.CONCEPT,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Corrupted embedding",
+            embedding=embedding,
+            provenance=valid_provenance,
+        )
+
+def test_embedding_rejects_values_beyond_float32(valid_embedding, valid_provenance):
+    """Finite float64 values that overflow float32 are reported as such, not as NaN/inf."""
+    embedding = list(valid_embedding)
+    embedding[511] = 1e39
+
+    with pytest.raises(ValueError, match="out of float32 range"):
+        MemoryNode(
+            type=NodeType.CONCEPT,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Overflowing embedding",
+            embedding=embedding,
+            provenance=valid_provenance,
+        )
+
+def test_cosine_similarity_uses_cached_norm(valid_embedding, valid_provenance):
+    """Similarity search reuses each node's norm until its embedding is replaced."""
+    def make(embedding):
+        return MemoryNode(
+            type=NodeType.CONCEPT,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Similarity search",
+            embedding=embedding,
+            provenance=valid_provenance,
+        )
+
+    a = make(valid_embedding)
+    b = make([0.05] * 512 + [-0.05] * 512)
+
+    assert a.embedding_norm == pytest.approx(np.sqrt(1024) * 0.05)
+    assert a.cosine_similarity(a) == pytest.approx(1.0)
+    assert a.cosine_similarity(b) == pytest.approx(0.0, abs=1e-6)
+
+    scaled = a.model_copy(update={"embedding": np.full(1024, 1.0, dtype=np.float32)})
+    assert scaled.embedding_norm == pytest.approx(32.0)
+
+    a.embedding = np.zeros(1024, dtype=np.float32)
+    assert a.embedding_norm == 0.0
+    assert a.cosine_similarity(b) == 0.0
+
+    # In-place edits would bypass cache invalidation, so the array is read-only
+    for node in (a, scaled, a.model_copy(), a.model_copy(deep=True)):
+        with pytest.raises(ValueError, match="read-only"):
+            node.embedding[:] = 1.0
+    assert a.embedding_norm == 0.0
+
+def test_similarity_rejects_mismatched_dimensions(valid_embedding, valid_provenance):
+    """Embeddings of different widths are rejected with both model names, not a numpy error."""
+    bge = MemoryNode(
+        type=NodeType.CONCEPT,
+        domains=[KnowledgeDomain.GENERAL],
+        content_summary="Similarity search",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+    )
+    openai = bge.model_copy(update={
+        "embedding": [0.05] * 1536, "embedding_model": "text-embedding-3-small",
+    })
+
+    for compare in (bge.cosine_similarity, bge.approx_cosine_similarity):
+        with pytest.raises(ValueError, match="'bge-m3-v1.5'.*'text-embedding-3-small'"):
+            compare(openai)
+
+def test_quantized_embedding_approximates_float32(valid_provenance):
+    """The int8 view is a quarter of the size and tracks the float32 similarity closely."""
+    rng = np.random.default_rng(7)
+
+    def make():
+        return MemoryNode(
+            type=NodeType.CONCEPT,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Quantized retrieval",
+            embedding=rng.standard_normal(1024),
+            provenance=valid_provenance,
+        )
+
+    a, b = make(), make()
+    q, scale = a.quantized_embedding
+
+    assert q.dtype == np.int8
+    assert q.nbytes * 4 == a.embedding.nbytes
+    assert np.abs(q * scale - a.embedding).max() <= scale / 2 + 1e-6
+    assert a.approx_cosine_similarity(b) == pytest.approx(a.cosine_similarity(b), abs=1e-2)
+    assert a.approx_cosine_similarity(a) == pytest.approx(1.0, abs=1e-3)
+
+    flipped = a.model_copy(update={"embedding": -a.embedding})
+    q_flipped, _ = flipped.quantized_embedding
+    assert np.array_equal(q_flipped, -q)
+
+    # The int8 copy cannot go stale through an in-place edit of the source vector
+    with pytest.raises(ValueError, match="read-only"):
+        a.embedding *= 2.0
+    assert a.quantized_embedding[0] is q
+    assert np.abs(q * scale - a.embedding).max() <= scale / 2 + 1e-6
+
+def test_constant_leaf_defaults_are_shared(valid_embedding, valid_provenance):
+    """Frozen defaults without timestamps are one shared instance, not rebuilt per node."""
+    a, b = (
+        MemoryNode(
+            type=NodeType.EPISODIC,
+            domains=[KnowledgeDomain.GENERAL],
+            content_summary="Shared defaults",
+            embedding=valid_embedding,
+            provenance=valid_provenance,
+        )
+        for _ in range(2)
+    )
+
+    assert a.identity is b.identity
+    assert a.recall is b.recall
+    assert a.utility is not b.utility  # carries its own last_accessed stamp
+
+def test_leaf_dataclasses_coerce_direct_construction(valid_embedding, valid_provenance):
+    """Leaf dataclasses built without Pydantic still coerce ids and numbers, or raise ValueError."""
+    target = uuid.uuid4()
+    edge = CausalEdge(target_id=str(target), relation="reinforces", weight="0.5")
+
+    assert edge.target_id == target
+    assert edge.relation is EdgeRelation.REINFORCES
+    assert edge.weight == 0.5
+    assert len(EdgeStore.from_edges([edge])) == 1
+    assert MemoryUtility(access_count="3").access_count == 3
+
+    with pytest.raises(ValueError, match="access_count must be int"):
+        MemoryUtility(access_count="lots")
+    with pytest.raises(ValueError, match="recall_count must be int"):
+        RecallDynamics(recall_count=1.5)
+    with pytest.raises(ValueError, match="weight must be float"):
+        IdentityBinding(weight="heavy")
+
+    node = MemoryNode(
+        type=NodeType.CONCEPT,
+        domains=[KnowledgeDomain.SYSTEMS],
+        content_summary="Validated edge helper",
+        embedding=valid_embedding,
+        provenance=valid_provenance,
+    )
+    with pytest.raises(ValueError, match="target_id must be a UUID"):
+        node.add_edge("not-a-uuid", EdgeRelation.CAUSES)
+    assert node.edges == []